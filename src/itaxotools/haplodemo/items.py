@@ -157,6 +157,8 @@ class BezierCurve(QtWidgets.QGraphicsPathItem):
 
 
 class Label(QtWidgets.QGraphicsItem):
+    role = 'label'
+
     def __init__(self, text, parent):
         super().__init__(parent)
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, False)
@@ -173,8 +175,11 @@ class Label(QtWidgets.QGraphicsItem):
         self.font = font
 
         self.text = text
+        self.text_center = self.getTextCenter()
         self.rect = self.getCenteredRect()
         self.outline = self.getTextOutline()
+        self._bounding_rect = None
+        self._shape = None
 
         self.state_hovered = False
         self.state_pressed = False
@@ -224,20 +229,24 @@ class Label(QtWidgets.QGraphicsItem):
 
     @override
     def boundingRect(self):
-        return self.rect
+        if self._bounding_rect is None:
+            # Expand to account for the outline
+            self._bounding_rect = QtCore.QRectF(self.rect).adjusted(-5, -5, 5, 5)
+        return self._bounding_rect
 
     @override
     def shape(self):
-        path = QtGui.QPainterPath()
-        path.addRect(self.rect)
-        return path
+        if self._shape is None:
+            path = QtGui.QPainterPath()
+            path.addRect(self.rect)
+            self._shape = path
+        return self._shape
 
     @override
     def paint(self, painter, options, widget=None):
         painter.save()
 
-        pos = QtGui.QFontMetrics(self.font).boundingRect(self.text).center()
-        pos -= self.rect.center()
+        pos = self.text_center - self.rect.center()
         painter.translate(-pos)
 
         self.paintOutline(painter)
@@ -273,6 +282,8 @@ class Label(QtWidgets.QGraphicsItem):
 
     def set_highlight_color(self, value):
         self._highlight_color = value
+        if self.isHighlighted():
+            self.update()
 
     def set_hovered(self, value):
         self.state_hovered = value
@@ -281,6 +292,8 @@ class Label(QtWidgets.QGraphicsItem):
     def setRect(self, rect):
         self.prepareGeometryChange()
         self.rect = rect
+        self._bounding_rect = None
+        self._shape = None
 
     def isHighlighted(self):
         if self.state_pressed:
@@ -295,6 +308,9 @@ class Label(QtWidgets.QGraphicsItem):
         rect = rect.adjusted(-3, -3, 3, 3)
         return rect
 
+    def getTextCenter(self):
+        return QtGui.QFontMetrics(self.font).boundingRect(self.text).center()
+
     def getTextOutline(self):
         path = QtGui.QPainterPath()
         path.setFillRule(QtCore.Qt.WindingFill)
@@ -308,13 +324,17 @@ class Label(QtWidgets.QGraphicsItem):
     def setText(self, text):
         center = self.rect.center()
         self.text = text
+        self.text_center = self.getTextCenter()
         self.outline = self.getTextOutline()
         rect = self.getCenteredRect()
         rect.moveCenter(center)
         self.setRect(rect)
+        self.update()
 
 
 class Edge(QtWidgets.QGraphicsLineItem):
+    role = 'edge'
+
     def __init__(self, node1, node2, weight=1):
         super().__init__()
         self.setAcceptHoverEvents(True)
@@ -329,6 +349,9 @@ class Edge(QtWidgets.QGraphicsLineItem):
         self.locked_label_pos = None
         self.locked_label_rect_pos = None
         self._highlight_color = QtCore.Qt.magenta
+        self._bounding_rect = None
+        self._shape = None
+        self._hit_line = None
 
         self.label = Label(str(weight), self)
         self.label.set_white_outline(True)
@@ -337,15 +360,24 @@ class Edge(QtWidgets.QGraphicsLineItem):
 
     @override
     def shape(self):
-        line = self.line()
-        path = QtGui.QPainterPath()
-        if line == QtCore.QLineF():
-            return path
-        path.moveTo(line.p1())
-        path.lineTo(line.p2())
-        pen = self.pen()
-        pen.setWidth(pen.width() + 16)
-        return shapeFromPath(path, pen)
+        if self._shape is None:
+            self._shape = self.getShape()
+        return self._shape
+
+    @override
+    def setLine(self, *args):
+        super().setLine(*args)
+        self._bounding_rect = None
+        self._shape = None
+        self._hit_line = None
+
+    def getHitLine(self):
+        # Origin and direction in item coordinates, used for hit-testing
+        if self._hit_line is None:
+            line = self.line()
+            unit = line.unitVector()
+            self._hit_line = (line.x1(), line.y1(), unit.dx(), unit.dy())
+        return self._hit_line
 
     @override
     def mouseDoubleClickEvent(self, event):
@@ -363,8 +395,10 @@ class Edge(QtWidgets.QGraphicsLineItem):
 
     @override
     def boundingRect(self):
-        # Expand to account for segment dots
-        return super().boundingRect().adjusted(-5, -5, 5, 5)
+        if self._bounding_rect is None:
+            # Expand to account for segment dots and error highlight
+            self._bounding_rect = super().boundingRect().adjusted(-10, -10, 10, 10)
+        return self._bounding_rect
 
     @override
     def pen(self):
@@ -398,6 +432,17 @@ class Edge(QtWidgets.QGraphicsLineItem):
 
         painter.restore()
 
+    def getShape(self):
+        line = self.line()
+        path = QtGui.QPainterPath()
+        if line == QtCore.QLineF():
+            return path
+        path.moveTo(line.p1())
+        path.lineTo(line.p2())
+        pen = self.pen()
+        pen.setWidth(pen.width() + 16)
+        return shapeFromPath(path, pen)
+
     def paintHoverLine(self, painter):
         painter.save()
         pen = QtGui.QPen(self._highlight_color, 6)
@@ -510,6 +555,7 @@ class Edge(QtWidgets.QGraphicsLineItem):
 
     def set_style(self, style):
         self.style = style
+        self._shape = None
         self.label.setVisible(self.style.has_text)
         self.resetLabelPosition(style.text_offset)
         self.update()
@@ -525,6 +571,7 @@ class Edge(QtWidgets.QGraphicsLineItem):
 
     def set_highlight_color(self, value):
         self._highlight_color = value
+        self.label.set_highlight_color(value)
 
     def resetLabelPosition(self, offset: bool | None):
         if not offset:
@@ -600,8 +647,12 @@ class Edge(QtWidgets.QGraphicsLineItem):
 
 
 class Vertex(QtWidgets.QGraphicsEllipseItem):
+    role = 'vertex'
+
     def __init__(self, x, y, r=2.5):
         super().__init__(-r, -r, r * 2, r * 2)
+        self._bounding_rect = None
+        self._shape = None
 
         self.parent = None
         self.children = list()
@@ -645,14 +696,29 @@ class Vertex(QtWidgets.QGraphicsEllipseItem):
 
     @override
     def boundingRect(self):
-        # Hack to prevent drag n draw glitch
-        return self.rect().adjusted(-50, -50, 50, 50)
+        if self._bounding_rect is None:
+            # Expand to account for the highlighted border
+            m = self.getPaintMargin()
+            self._bounding_rect = self.rect().adjusted(-m, -m, m, m)
+        return self._bounding_rect
+
+    def getPaintMargin(self):
+        # Highlighted vertices are drawn at twice the radius
+        return self.rect().width() / 2 + 3
 
     @override
     def shape(self):
-        path = QtGui.QPainterPath()
-        path.addEllipse(self.rect().adjusted(-3, -3, 3, 3))
-        return path
+        if self._shape is None:
+            path = QtGui.QPainterPath()
+            path.addEllipse(self.rect().adjusted(-3, -3, 3, 3))
+            self._shape = path
+        return self._shape
+
+    @override
+    def setRect(self, *args):
+        super().setRect(*args)
+        self._bounding_rect = None
+        self._shape = None
 
     @override
     def itemChange(self, change, value):
@@ -732,10 +798,7 @@ class Vertex(QtWidgets.QGraphicsEllipseItem):
 
     def set_hovered(self, value):
         self.state_hovered = value
-        if self.parent and any((
-            self.isMovementRotational(),
-            self.isMovementRecursive())
-        ):
+        if self.parent and (self.isMovementRecursive() or self.isMovementRotational()):
             edge = self.edges[self.parent]
             edge.set_hovered(value)
         self.update()
@@ -869,11 +932,20 @@ class Node(Vertex):
         super().mouseDoubleClickEvent(event)
         self.label.mouseDoubleClickEvent(event)
 
+    @override
+    def set_highlight_color(self, value):
+        super().set_highlight_color(value)
+        self.label.set_highlight_color(value)
+
     @override
     def paint(self, painter, options, widget=None):
         self.paint_node(painter)
         self.paint_pies(painter)
 
+    @override
+    def getPaintMargin(self):
+        return 3
+
     def paint_node(self, painter):
         painter.save()
         if self.pies:
@@ -916,6 +988,8 @@ class Node(Vertex):
             span = int(5760 * weight / total_weight)
             self.pies[color] = span
 
+        self.update()
+
     def adjust_radius(self, a=10, b=2, c=0.4, d=1, e=0, f=0):
         r = self.radius_from_size(self.weight, a, b, c, d, e, f)
         self.radius = r
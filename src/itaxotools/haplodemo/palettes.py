@@ -33,6 +33,10 @@ class Palette(list, Type):
             return super().__getitem__(index)
         return self.default
 
+    def take(self, count):
+        colors = super().__getitem__(slice(count))
+        return colors + [self.default] * (count - len(colors))
+
     @property
     def label(self):
         return type(self).__name__
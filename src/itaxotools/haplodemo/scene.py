@@ -18,22 +18,33 @@
 
 from PySide6 import QtCore, QtGui, QtOpenGLWidgets, QtSvg, QtWidgets
 
-from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 from itaxotools.common.bindings import (
     Binder, Instance, Property, PropertyObject)
 
-from .items import BezierCurve, Edge, EdgeStyle, Label, Node, Vertex
+from .items import BezierCurve, Edge, EdgeStyle, Node, Vertex
 from .palettes import Palette
 
 
-@dataclass
+@dataclass(slots=True)
 class Division:
     key: str
     color: str
 
 
+class ColorMap(dict):
+    __slots__ = ('default',)
+
+    def __init__(self, map, default):
+        super().__init__(map)
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+
 class DivisionListModel(QtCore.QAbstractListModel):
     colorMapChanged = QtCore.Signal(object)
 
@@ -42,6 +53,15 @@ class DivisionListModel(QtCore.QAbstractListModel):
         self._palette = palette
         self._default_color = palette.default
         self._divisions = list()
+        self._icon_cache: dict[str, QtGui.QIcon] = dict()
+        self._color_map = ColorMap({}, self._default_color)
+        self._color_map_changed = True
+
+        self._color_map_timer = QtCore.QTimer(self)
+        self._color_map_timer.setSingleShot(True)
+        self._color_map_timer.setInterval(0)
+        self._color_map_timer.timeout.connect(self._emit_color_map)
+
         self.set_divisions_from_keys(names)
         self.set_palette(palette)
 
@@ -49,24 +69,74 @@ class DivisionListModel(QtCore.QAbstractListModel):
         self.modelReset.connect(self.handle_data_changed)
 
     def set_divisions_from_keys(self, keys):
+        if not keys and not self._divisions:
+            return
         self.beginResetModel()
-        palette = self._palette
-        self._divisions = [Division(keys[i], palette[i]) for i in range(len(keys))]
+        colors = self._palette.take(len(keys))
+        self._divisions = [Division(key, color) for key, color in zip(keys, colors)]
+        self._icon_cache.clear()
+        self._rebuild_color_map()
         self.endResetModel()
 
     def set_palette(self, palette):
-        self.beginResetModel()
+        self._palette = palette
         self._default_color = palette.default
-        for index, division in enumerate(self._divisions):
-            division.color = palette[index]
-        self.endResetModel()
+        self._icon_cache.clear()
+        colors = palette.take(len(self._divisions))
+        for division, color in zip(self._divisions, colors):
+            division.color = color
+        self._rebuild_color_map()
+
+        # Only colors changed, no need to reset views
+        if not self._divisions:
+            self.handle_data_changed()
+            return
+        top_left = self.index(0)
+        bottom_right = self.index(len(self._divisions) - 1)
+        self.dataChanged.emit(top_left, bottom_right, [QtCore.Qt.DecorationRole, QtCore.Qt.EditRole])
 
     def get_color_map(self):
+        # Maintained incrementally, treat as read-only
+        return self._color_map
+
+    def _rebuild_color_map(self):
         map = {d.key: d.color for d in self._divisions}
-        return defaultdict(lambda: self._default_color, map)
+        color_map = ColorMap(map, self._default_color)
+        if color_map == self._color_map and color_map.default == self._color_map.default:
+            return
+        self._color_map = color_map
+        self._color_map_changed = True
 
     def handle_data_changed(self, *args, **kwargs):
-        self.colorMapChanged.emit(self.get_color_map())
+        # Coalesce bursts of changes into a single emission
+        self._color_map_timer.start()
+
+    def _emit_color_map(self):
+        if not self._color_map_changed:
+            return
+        self._color_map_changed = False
+        self.colorMapChanged.emit(self._color_map)
+
+    @staticmethod
+    def get_swatch(color, qcolor=None):
+        # Shared with other models through the global pixmap cache
+        key = f'divswatch:{color}'
+        pixmap = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(key, pixmap):
+            if qcolor is None:
+                qcolor = QtGui.QColor(color)
+            pixmap = QtGui.QPixmap(16, 16)
+            pixmap.fill(qcolor)
+            QtGui.QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def get_icon(self, color, qcolor=None):
+        # Built on first request, dropped whenever the divisions are reset
+        icon = self._icon_cache.get(color)
+        if icon is None:
+            icon = QtGui.QIcon(self.get_swatch(color, qcolor))
+            self._icon_cache[color] = icon
+        return icon
 
     def rowCount(self, parent=QtCore.QModelIndex()):
         return len(self._divisions)
@@ -83,10 +153,7 @@ class DivisionListModel(QtCore.QAbstractListModel):
         elif role == QtCore.Qt.EditRole:
             return color
         elif role == QtCore.Qt.DecorationRole:
-            color = QtGui.QColor(color)
-            pixmap = QtGui.QPixmap(16, 16)
-            pixmap.fill(color)
-            return QtGui.QIcon(pixmap)
+            return self.get_icon(color)
 
         return None
 
@@ -99,10 +166,17 @@ class DivisionListModel(QtCore.QAbstractListModel):
             if not color.startswith('#'):
                 color = '#' + color
 
-            if not QtGui.QColor.isValidColor(color):
+            # Parse once, then reuse for the decoration
+            qcolor = QtGui.QColor(color)
+            if not qcolor.isValid():
                 return False
+            self.get_icon(color, qcolor)
 
-            self._divisions[index.row()].color = color
+            division = self._divisions[index.row()]
+            division.color = color
+            if self._color_map[division.key] != color:
+                self._color_map[division.key] = color
+                self._color_map_changed = True
             self.dataChanged.emit(index, index)
             return True
 
@@ -119,6 +193,7 @@ class Settings(PropertyObject):
     rotational_movement = Property(bool, True)
     recursive_movement = Property(bool, True)
     label_movement = Property(bool, False)
+    label_locked = Property(bool, True)
 
     node_a = Property(float, 10)
     node_b = Property(float, 2)
@@ -135,15 +210,103 @@ class Settings(PropertyObject):
         self.binder = Binder()
         self.binder.bind(self.properties.palette, self.divisions.set_palette)
         self.binder.bind(self.properties.palette, self.properties.highlight_color, lambda x: x.highlight)
+        self.binder.bind(self.properties.label_movement, self.properties.label_locked, lambda x: not x)
+
+
+class NodeRegistry(QtCore.QObject):
+    """Forward settings to all scene items through a single connection"""
+
+    def __init__(self, settings, parent=None):
+        super().__init__(parent)
+        self.settings = settings
+        self.vertices = list()
+        self.nodes = list()
+        self.edges = list()
+
+        # Everything lives in the GUI thread, skip the thread affinity check
+        direct = QtCore.Qt.DirectConnection
+        properties = settings.properties
+        settings.divisions.colorMapChanged.connect(self.update_colors, direct)
+        properties.rotational_movement.notify.connect(self.set_rotational_setting, direct)
+        properties.recursive_movement.notify.connect(self.set_recursive_setting, direct)
+        properties.label_locked.notify.connect(self.set_label_locked, direct)
+        properties.highlight_color.notify.connect(self.set_highlight_color, direct)
+
+    def add_vertex(self, item):
+        settings = self.settings
+        item.set_rotational_setting(settings.rotational_movement)
+        item.set_recursive_setting(settings.recursive_movement)
+        item.set_highlight_color(QtGui.QColor(settings.highlight_color))
+        self.vertices.append(item)
+
+    def add_node(self, item):
+        settings = self.settings
+        item.set_rotational_setting(settings.rotational_movement)
+        item.set_recursive_setting(settings.recursive_movement)
+        item.label.set_locked(settings.label_locked)
+        item.set_highlight_color(QtGui.QColor(settings.highlight_color))
+        item.update_colors(settings.divisions.get_color_map())
+        self.nodes.append(item)
+
+    def add_edge(self, item):
+        settings = self.settings
+        item.label.set_locked(settings.label_locked)
+        item.set_highlight_color(QtGui.QColor(settings.highlight_color))
+        self.edges.append(item)
+
+    def remove(self, item):
+        for items in (self.vertices, self.nodes, self.edges):
+            if item in items:
+                items.remove(item)
+
+    def clear(self):
+        self.vertices = list()
+        self.nodes = list()
+        self.edges = list()
+
+    def update_colors(self, color_map):
+        for node in self.nodes:
+            node.update_colors(color_map)
+
+    def set_rotational_setting(self, value):
+        for vertex in self.vertices:
+            vertex.set_rotational_setting(value)
+        for node in self.nodes:
+            node.set_rotational_setting(value)
+
+    def set_recursive_setting(self, value):
+        for vertex in self.vertices:
+            vertex.set_recursive_setting(value)
+        for node in self.nodes:
+            node.set_recursive_setting(value)
+
+    def set_label_locked(self, value):
+        for node in self.nodes:
+            node.label.set_locked(value)
+        for edge in self.edges:
+            edge.label.set_locked(value)
+
+    def set_highlight_color(self, value):
+        for vertex in self.vertices:
+            vertex.set_highlight_color(value)
+        for node in self.nodes:
+            node.set_highlight_color(value)
+        for edge in self.edges:
+            edge.set_highlight_color(value)
 
 
 class GraphicsScene(QtWidgets.QGraphicsScene):
     def __init__(self, settings, parent=None):
         super().__init__(parent)
         self.setBackgroundBrush(QtGui.QBrush(QtGui.QColor(QtCore.Qt.white)))
+        # Index items while the scene is static, drop the index while dragging
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.BspTreeIndex)
+        self.dropped_index_method = None
         self.settings = settings
         self.hovered_item = None
-        self.binder = Binder()
+        self.hovered_key = None
+        self.hover_event = QtWidgets.QGraphicsSceneHoverEvent()
+        self.registry = NodeRegistry(settings, self)
 
     def event(self, event):
         if event.type() == QtCore.QEvent.GraphicsSceneLeave:
@@ -152,10 +315,12 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
 
     def mouseLeaveEvent(self, event):
         if self.hovered_item:
-            hover = QtWidgets.QGraphicsSceneHoverEvent()
+            hover = self.hover_event
             # hover.type = lambda: event.type()
             self.hovered_item.hoverLeaveEvent(hover)
             self.hovered_item = None
+        self.restore_index()
+        self.invalidate_hover_cache()
 
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
@@ -173,6 +338,8 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
                 item.mouseReleaseEvent(event)
                 item.ungrabMouse()
                 event.accept()
+        self.restore_index()
+        self.invalidate_hover_cache()
         self.mouseMoveEvent(event)
 
     def mouseDoubleClickEvent(self, event):
@@ -184,14 +351,29 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
                 event.accept()
 
     def mouseMoveEvent(self, event):
-        if self.mouseGrabberItem() or event.buttons():
+        grabber = self.mouseGrabberItem()
+        if grabber or event.buttons():
+            if grabber and event.scenePos() != event.buttonDownScenePos(QtCore.Qt.LeftButton):
+                self.drop_index()
             super().mouseMoveEvent(event)
             return
 
+        # The grab may have ended without a release reaching the scene
+        self.restore_index()
         event.accept()
 
+        # Skip hit-testing while the cursor stays on the same screen pixel,
+        # views drop the cache when they scroll or zoom
+        screen = event.screenPos()
+        key = (screen.x(), screen.y(), self.settings.label_locked)
+        if key == self.hovered_key:
+            return
+        self.hovered_key = key
+
+        pos = event.scenePos()
+
         hover = self._hoverEventFromMouseEvent(event)
-        item = self.getItemAtPos(event.scenePos())
+        item = self.getItemAtPos(pos)
 
         if self.hovered_item:
             if item == self.hovered_item:
@@ -203,8 +385,25 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         if item:
             item.hoverEnterEvent(hover)
 
+    def invalidate_hover_cache(self):
+        self.hovered_key = None
+
+    def drop_index(self):
+        # Dragged items would update the index on every step
+        if self.dropped_index_method is not None:
+            return
+        self.dropped_index_method = self.itemIndexMethod()
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+
+    def restore_index(self):
+        if self.dropped_index_method is None:
+            return
+        self.setItemIndexMethod(self.dropped_index_method)
+        self.dropped_index_method = None
+
     def _hoverEventFromMouseEvent(self, mouse):
-        hover = QtWidgets.QGraphicsSceneHoverEvent()
+        # Reused, items do not keep hold of the event
+        hover = self.hover_event
         # hover.widget = lambda: mouse.widget()
         hover.setPos(mouse.pos())
         hover.setScenePos(mouse.scenePos())
@@ -218,24 +417,21 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
 
     def getItemAtPos(self, pos, ignore_edges=False, ignore_labels=None):
         if ignore_labels is None:
-            ignore_labels = not self.settings.label_movement
+            ignore_labels = self.settings.label_locked
 
-        point = QtGui.QVector2D(pos.x(), pos.y())
         closest_edge_item = None
         closest_edge_distance = float('inf')
         for item in super().items(pos):
-            if isinstance(item, Vertex):
+            role = getattr(item, 'role', None)
+            if role == 'vertex':
                 return item
-            if isinstance(item, Label):
+            if role == 'label':
                 if not ignore_labels:
                     return item
-            if isinstance(item, Edge) and not ignore_edges:
-                line = item.line()
-                p1 = item.mapToScene(line.p1())
-                p1 = QtGui.QVector2D(p1.x(), p1.y())
-                unit = line.unitVector()
-                unit = QtGui.QVector2D(unit.dx(), unit.dy())
-                distance = point.distanceToLine(p1, unit)
+            if role == 'edge' and not ignore_edges:
+                x1, y1, ux, uy = item.getHitLine()
+                point = item.mapFromScene(pos)
+                distance = abs((point.x() - x1) * uy - (point.y() - y1) * ux)
                 if distance < closest_edge_distance:
                     closest_edge_distance = distance
                     closest_edge_item = item
@@ -248,46 +444,80 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         self.addItem(item)
         item.setPos(60, 160)
 
+    @contextmanager
+    def bulk_insert(self):
+        # Skip indexing every single insertion, build the index once at the end
+        index_method = self.itemIndexMethod()
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        blocked = self.blockSignals(True)
+        views = [view for view in self.views() if view.updatesEnabled()]
+        for view in views:
+            view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for view in views:
+                view.setUpdatesEnabled(True)
+            self.blockSignals(blocked)
+            self.setItemIndexMethod(index_method)
+            self.update()
+
+    @contextmanager
+    def uncached(self):
+        # Cached items would be recorded as bitmaps instead of vector paths
+        cached = [(item, item.cacheMode()) for item in self.items()]
+        cached = [(item, mode) for item, mode in cached if mode != QtWidgets.QGraphicsItem.NoCache]
+        for item, _ in cached:
+            item.setCacheMode(QtWidgets.QGraphicsItem.NoCache)
+        try:
+            yield
+        finally:
+            for item, mode in cached:
+                item.setCacheMode(mode)
+
     def addNodes(self):
-        node1 = self.create_node(85, 140, 35, 'Alphanumerical', {'X': 4, 'Y': 3, 'Z': 2})
-        self.addItem(node1)
+        with self.bulk_insert():
+            node1 = self.create_node(85, 140, 35, 'Alphanumerical', {'X': 4, 'Y': 3, 'Z': 2})
+            self.addItem(node1)
 
-        node2 = self.create_node(node1.pos().x() + 95, node1.pos().y() - 30, 20, 'Beta', {'X': 4, 'Z': 2})
-        self.add_child(node1, node2, 2)
+            node2 = self.create_node(node1.pos().x() + 95, node1.pos().y() - 30, 20, 'Beta', {'X': 4, 'Z': 2})
+            self.add_child(node1, node2, 2)
 
-        node3 = self.create_node(node1.pos().x() + 115, node1.pos().y() + 60, 25, 'C', {'Y': 6, 'Z': 2})
-        self.add_child(node1, node3, 3)
+            node3 = self.create_node(node1.pos().x() + 115, node1.pos().y() + 60, 25, 'C', {'Y': 6, 'Z': 2})
+            self.add_child(node1, node3, 3)
 
-        node4 = self.create_node(node3.pos().x() + 60, node3.pos().y() - 30, 15, 'D', {'Y': 1})
-        self.add_child(node3, node4, 1)
+            node4 = self.create_node(node3.pos().x() + 60, node3.pos().y() - 30, 15, 'D', {'Y': 1})
+            self.add_child(node3, node4, 1)
 
-        vertex1 = self.create_vertex(node3.pos().x() - 60, node3.pos().y() + 60)
-        self.add_child(node3, vertex1, 2)
+            vertex1 = self.create_vertex(node3.pos().x() - 60, node3.pos().y() + 60)
+            self.add_child(node3, vertex1, 2)
 
-        node5 = self.create_node(vertex1.pos().x() - 80, vertex1.pos().y() + 40, 30, 'Error', {'?': 1})
-        self.add_child(vertex1, node5, 4)
+            node5 = self.create_node(vertex1.pos().x() - 80, vertex1.pos().y() + 40, 30, 'Error', {'?': 1})
+            self.add_child(vertex1, node5, 4)
 
-        node6 = self.create_node(vertex1.pos().x() + 60, vertex1.pos().y() + 20, 20, 'R', {'Z': 1})
-        self.add_child(vertex1, node6, 1)
+            node6 = self.create_node(vertex1.pos().x() + 60, vertex1.pos().y() + 20, 20, 'R', {'Z': 1})
+            self.add_child(vertex1, node6, 1)
 
-        node7 = self.create_node(vertex1.pos().x() + 100, vertex1.pos().y() + 80, 10, 'S', {'Z': 1})
-        self.add_sibling(node6, node7, 2)
+            node7 = self.create_node(vertex1.pos().x() + 100, vertex1.pos().y() + 80, 10, 'S', {'Z': 1})
+            self.add_sibling(node6, node7, 2)
 
-        node8 = self.create_node(vertex1.pos().x() + 20, vertex1.pos().y() + 80, 40, 'T', {'Y': 1})
-        self.add_sibling(node6, node8, 1)
-        self.add_sibling(node7, node8, 1)
+            node8 = self.create_node(vertex1.pos().x() + 20, vertex1.pos().y() + 80, 40, 'T', {'Y': 1})
+            self.add_sibling(node6, node8, 1)
+            self.add_sibling(node7, node8, 1)
 
-        node9 = self.create_node(node7.pos().x() + 20, node7.pos().y() - 40, 5, 'x', {'Z': 1})
-        self.add_child(node7, node9, 1)
+            node9 = self.create_node(node7.pos().x() + 20, node7.pos().y() - 40, 5, 'x', {'Z': 1})
+            self.add_child(node7, node9, 1)
 
     def addManyNodes(self, dx, dy):
-        for x in range(dx):
-            nodex = self.create_node(20, 80 * x, 15, f'x{x}', {'X': 1})
-            self.addItem(nodex)
+        # Items must stay top-level for dragging, so they are not grouped
+        with self.bulk_insert():
+            for x in range(dx):
+                nodex = self.create_node(20, 80 * x, 15, f'x{x}', {'X': 1})
+                self.addItem(nodex)
 
-            for y in range(dy):
-                nodey = self.create_node(nodex.pos().x() + 80 + 40 * y, nodex.pos().y() + 40, 15, f'y{y}', {'Y': 1})
-                self.add_child(nodex, nodey)
+                for y in range(dy):
+                    nodey = self.create_node(nodex.pos().x() + 80 + 40 * y, nodex.pos().y() + 40, 15, f'y{y}', {'Y': 1})
+                    self.add_child(nodex, nodey)
 
     def styleEdges(self, style_default=EdgeStyle.Bubbles, cutoff=3):
         if not cutoff:
@@ -297,54 +527,56 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
             EdgeStyle.Bars: EdgeStyle.Collapsed,
             EdgeStyle.Plain: EdgeStyle.PlainWithText,
         }[style_default]
-        edges = (item for item in self.items() if isinstance(item, Edge))
-
-        for edge in edges:
+        for edge in self.registry.edges:
             style = style_default if edge.segments <= cutoff else style_cutoff
             edge.set_style(style)
 
     def styleNodes(self, a=10, b=2, c=0.2, d=1, e=0, f=0):
-        nodes = (item for item in self.items() if isinstance(item, Node))
-        edges = (item for item in self.items() if isinstance(item, Edge))
-        for node in nodes:
+        for node in self.registry.nodes:
             node.adjust_radius(a, b, c, d, e, f)
-        for edge in edges:
+        for edge in self.registry.edges:
             edge.adjustPosition()
 
+    @staticmethod
+    def get_label_formatter(template, tokens):
+        # Skip str.format for templates that are constant or a single token
+        used = [token for token in tokens if token in template]
+        if not used:
+            return lambda **kwargs: template
+        if template in tokens:
+            field = tokens[template]
+            return lambda **kwargs: str(kwargs[field])
+        template = template.replace('{', '{{').replace('}', '}}')
+        for token in used:
+            template = template.replace(token, '{' + tokens[token] + '}')
+        return template.format
+
     def styleLabels(self, node_label_template, edge_label_template):
-        node_label_format = node_label_template.replace('NAME', '{name}').replace('WEIGHT', '{weight}')
-        edge_label_format = edge_label_template.replace('WEIGHT', '{weight}')
-        nodes = (item for item in self.items() if isinstance(item, Node))
-        edges = (item for item in self.items() if isinstance(item, Edge))
-        for node in nodes:
-            text = node_label_format.format(name=node.name, weight=node.weight)
+        node_label_format = self.get_label_formatter(node_label_template, {'NAME': 'name', 'WEIGHT': 'weight'})
+        edge_label_format = self.get_label_formatter(edge_label_template, {'WEIGHT': 'weight'})
+        for node in self.registry.nodes:
+            text = node_label_format(name=node.name, weight=node.weight)
             node.label.setText(text)
-        for edge in edges:
-            text = edge_label_format.format(weight=edge.weight)
+        for edge in self.registry.edges:
+            text = edge_label_format(weight=edge.weight)
             edge.label.setText(text)
 
     def create_vertex(self, *args, **kwargs):
         item = Vertex(*args, **kwargs)
-        self.binder.bind(self.settings.properties.rotational_movement, item.set_rotational_setting)
-        self.binder.bind(self.settings.properties.recursive_movement, item.set_recursive_setting)
-        self.binder.bind(self.settings.properties.highlight_color, item.set_highlight_color)
+        item.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        self.registry.add_vertex(item)
         return item
 
     def create_node(self, *args, **kwargs):
         item = Node(*args, **kwargs)
-        self.binder.bind(self.settings.divisions.colorMapChanged, item.update_colors)
-        self.binder.bind(self.settings.properties.rotational_movement, item.set_rotational_setting)
-        self.binder.bind(self.settings.properties.recursive_movement, item.set_recursive_setting)
-        self.binder.bind(self.settings.properties.label_movement, item.label.set_locked, lambda x: not x)
-        self.binder.bind(self.settings.properties.highlight_color, item.label.set_highlight_color)
-        self.binder.bind(self.settings.properties.highlight_color, item.set_highlight_color)
+        item.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        item.label.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        self.registry.add_node(item)
         return item
 
     def create_edge(self, *args, **kwargs):
         item = Edge(*args, **kwargs)
-        self.binder.bind(self.settings.properties.highlight_color, item.set_highlight_color)
-        self.binder.bind(self.settings.properties.label_movement, item.label.set_locked, lambda x: not x)
-        self.binder.bind(self.settings.properties.highlight_color, item.label.set_highlight_color)
+        self.registry.add_edge(item)
         return item
 
     def add_child(self, parent, child, segments=1):
@@ -361,9 +593,34 @@ class GraphicsScene(QtWidgets.QGraphicsScene):
         if not sibling.scene():
             self.addItem(sibling)
 
+    def getPaintedRect(self):
+        # Bounding rects include margins for drawing, frame exports tighter
+        rect = QtCore.QRectF()
+        for item in self.items():
+            if not item.isVisible():
+                continue
+            if getattr(item, 'role', None) == 'edge':
+                line = item.line()
+                local = QtCore.QRectF(line.p1(), line.p2()).normalized()
+            else:
+                local = item.shape().boundingRect()
+            rect = rect.united(item.mapRectToScene(local))
+        return rect
+
+    def addItem(self, item):
+        super().addItem(item)
+        self.invalidate_hover_cache()
+
+    def removeItem(self, item):
+        super().removeItem(item)
+        self.registry.remove(item)
+        self.invalidate_hover_cache()
+
     def clear(self):
         super().clear()
-        self.binder.unbind_all()
+        self.registry.clear()
+        self.hovered_item = None
+        self.invalidate_hover_cache()
         
 
 class GraphicsView(QtWidgets.QGraphicsView):
@@ -375,9 +632,12 @@ class GraphicsView(QtWidgets.QGraphicsView):
         self.setDragMode(QtWidgets.QGraphicsView.ScrollHandDrag)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.MinimalViewportUpdate)
+        self.setOptimizationFlags(QtWidgets.QGraphicsView.DontSavePainterState)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
         self.zoom_factor = 1.25
+        self.zoom_pending = 1.0
+        self.zoom_scheduled = False
 
         if opengl:
             self.enable_opengl()
@@ -385,8 +645,30 @@ class GraphicsView(QtWidgets.QGraphicsView):
     def wheelEvent(self, event):
         zoom_in = bool(event.angleDelta().y() > 0)
         zoom = self.zoom_factor if zoom_in else 1 / self.zoom_factor
+        # Coalesce bursts of wheel events into a single rescale
+        self.zoom_pending *= zoom
+        if not self.zoom_scheduled:
+            self.zoom_scheduled = True
+            QtCore.QTimer.singleShot(0, self.apply_zoom)
+
+    def apply_zoom(self):
+        zoom = self.zoom_pending
+        self.zoom_pending = 1.0
+        self.zoom_scheduled = False
+        self.invalidate_hover_cache()
         self.scale(zoom, zoom)
 
+    def scrollContentsBy(self, dx, dy):
+        # Invalidate first, the last mouse move is replayed while scrolling
+        self.invalidate_hover_cache()
+        super().scrollContentsBy(dx, dy)
+
+    def invalidate_hover_cache(self):
+        # Hover hits are cached by screen position
+        scene = self.scene()
+        if scene is not None:
+            scene.invalidate_hover_cache()
+
     def enterEvent(self, event):
         super().enterEvent(event)
         self.viewport().setCursor(QtCore.Qt.ArrowCursor)
@@ -409,19 +691,60 @@ class GraphicsView(QtWidgets.QGraphicsView):
         format.setDepthBufferSize(24)
         format.setStencilBufferSize(8)
         format.setSamples(8)
+        format.setSwapInterval(0)
 
         glwidget = QtOpenGLWidgets.QOpenGLWidget()
         glwidget.setFormat(format)
         self.setViewport(glwidget)
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.MinimalViewportUpdate)
 
     def clear_mouse(self):
         event = QtWidgets.QGraphicsSceneEvent(QtCore.QEvent.GraphicsSceneLeave)
         self.scene().mouseLeaveEvent(event)
 
-    def export_svg(self, file: str):
+    def render_picture(self):
+        # Record the scene once, then replay it for each export
         self.clear_mouse()
 
+        scene = self.scene()
+        source = scene.getPaintedRect()
+        target = QtCore.QRectF(QtCore.QPointF(0, 0), source.size())
+
+        picture = QtGui.QPicture()
+        painter = QtGui.QPainter()
+        painter.begin(picture)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.TextAntialiasing)
+        with scene.uncached():
+            scene.render(painter, target, source)
+        painter.end()
+
+        picture.setBoundingRect(target.toAlignedRect())
+        return picture
+
+    def paint_picture(self, painter, picture, target):
+        # Scale to fit the target while keeping the aspect ratio
+        source = QtCore.QRectF(picture.boundingRect())
+        if source.isEmpty():
+            return
+        scale = min(target.width() / source.width(), target.height() / source.height())
+
+        painter.save()
+        painter.translate(target.center())
+        painter.scale(scale, scale)
+        painter.translate(-source.center())
+        # Cancel the scaling Qt applies when replaying on a device of another dpi
+        device = painter.device()
+        painter.scale(
+            picture.logicalDpiX() / device.logicalDpiX(),
+            picture.logicalDpiY() / device.logicalDpiY())
+        painter.drawPicture(0, 0, picture)
+        painter.restore()
+
+    def export_svg(self, file: str, picture: QtGui.QPicture = None):
+        if picture is None:
+            picture = self.render_picture()
+
         generator = QtSvg.QSvgGenerator()
         generator.setFileName(file)
         generator.setSize(QtCore.QSize(200, 200))
@@ -429,30 +752,34 @@ class GraphicsView(QtWidgets.QGraphicsView):
 
         painter = QtGui.QPainter()
         painter.begin(generator)
-        self.render(painter)
+        self.paint_picture(painter, picture, QtCore.QRectF(generator.viewBox()))
         painter.end()
 
-    def export_pdf(self, file: str):
-        self.clear_mouse()
+    def export_pdf(self, file: str, picture: QtGui.QPicture = None):
+        if picture is None:
+            picture = self.render_picture()
 
         writer = QtGui.QPdfWriter(file)
 
         painter = QtGui.QPainter()
         painter.begin(writer)
-        self.render(painter)
+        self.paint_picture(painter, picture, QtCore.QRectF(0, 0, writer.width(), writer.height()))
         painter.end()
 
-    def export_png(self, file: str):
-        self.clear_mouse()
+    def export_png(self, file: str, picture: QtGui.QPicture = None):
+        if picture is None:
+            picture = self.render_picture()
 
         width, height = 400, 400
-        pixmap = QtGui.QPixmap(width, height)
-        pixmap.fill(QtCore.Qt.white)
+        ratio = self.devicePixelRatioF()
+        image = QtGui.QImage(int(width * ratio), int(height * ratio), QtGui.QImage.Format_RGB32)
+        image.setDevicePixelRatio(ratio)
+        image.fill(QtCore.Qt.white)
 
         painter = QtGui.QPainter()
-        painter.begin(pixmap)
+        painter.begin(image)
         painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        self.render(painter)
+        self.paint_picture(painter, picture, QtCore.QRectF(0, 0, width, height))
         painter.end()
 
-        pixmap.save(file)
+        image.save(file)
@@ -74,24 +74,53 @@ class ToggleButton(QtWidgets.QPushButton):
             QtCore.QPoint(-3, 0),
             QtCore.QPoint(-2, 3),
             QtCore.QPoint(5, -5)])
+        self._checkmark_pixmap = None
+        self._text_width = None
+
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.FontChange:
+            self._text_width = None
+        super().changeEvent(event)
+
+    def setText(self, text):
+        super().setText(text)
+        self._text_width = None
 
     def paintEvent(self, event):
         super().paintEvent(event)
         if not self.isChecked():
             return
 
-        m = QtGui.QFontMetrics(self.font())
-        w = self.width() - m.boundingRect(self.text()).width()
+        if self._text_width is None:
+            m = QtGui.QFontMetrics(self.font())
+            self._text_width = m.boundingRect(self.text()).width()
+        w = self.width() - self._text_width
         w = w / 2 - 14
         h = self.height() / 2 + 1
 
         painter = QtGui.QPainter(self)
-        painter.translate(w, h)
-        painter.setPen(QtGui.QPen(QtGui.QColor('#333'), 1.5))
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        painter.drawPolyline(self.checkmark)
+        painter.drawPixmap(QtCore.QPointF(w - 5, h - 7), self.getCheckmarkPixmap())
         painter.end()
 
+    def getCheckmarkPixmap(self):
+        # Rasterize once, redraw only if the screen scaling changes
+        ratio = self.devicePixelRatioF()
+        pixmap = self._checkmark_pixmap
+        if pixmap is None or pixmap.devicePixelRatio() != ratio:
+            pixmap = QtGui.QPixmap(int(12 * ratio), int(12 * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(QtCore.Qt.transparent)
+
+            painter = QtGui.QPainter(pixmap)
+            painter.translate(5, 7)
+            painter.setPen(QtGui.QPen(QtGui.QColor('#333'), 1.5))
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.drawPolyline(self.checkmark)
+            painter.end()
+
+            self._checkmark_pixmap = pixmap
+        return pixmap
+
     def sizeHint(self):
         return super().sizeHint() + QtCore.QSize(48, 0)
 
@@ -101,21 +130,25 @@ class PaletteSelector(QtWidgets.QComboBox):
 
     def __init__(self):
         super().__init__()
-        self._palettes = []
-        for palette in Palette:
-            self._palettes.append(palette)
-            self.addItem(palette.label)
+        self._indices = dict()
+        for index, palette in enumerate(Palette):
+            self._indices[palette] = index
+            self.addItem(palette.label, palette)
         self.currentIndexChanged.connect(self.handleIndexChanged)
 
     def handleIndexChanged(self, index):
-        self.currentValueChanged.emit(self._palettes[index]())
+        self.currentValueChanged.emit(self.itemData(index)())
 
     def setValue(self, value):
-        index = self._palettes.index(value.type)
+        index = self._indices[value.type]
         self.setCurrentIndex(index)
 
 
 class ColorDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._editor = None
+
     def paint(self, painter, option, index):
         super().paint(painter, option, index)
 
@@ -126,9 +159,18 @@ class ColorDelegate(QtWidgets.QStyledItemDelegate):
             icon.paint(painter, decoration_rect)
 
     def createEditor(self, parent, option, index):
-        editor = QtWidgets.QColorDialog(parent=parent)
-        editor.setOption(QtWidgets.QColorDialog.DontUseNativeDialog, True)
-        return editor
+        # Construct the dialog once and reuse it for all edits
+        if self._editor is None:
+            self._editor = QtWidgets.QColorDialog(parent=parent)
+            self._editor.setOption(QtWidgets.QColorDialog.DontUseNativeDialog, True)
+        elif self._editor.parent() is not parent:
+            self._editor.setParent(parent, self._editor.windowFlags())
+        return self._editor
+
+    def destroyEditor(self, editor, index):
+        if editor is self._editor:
+            return
+        super().destroyEditor(editor, index)
 
     def setEditorData(self, editor, index):
         color = index.model().data(index, QtCore.Qt.EditRole)
@@ -152,3 +194,6 @@ class DivisionView(QtWidgets.QListView):
         super().__init__()
         self.setModel(divisions)
         self.setItemDelegate(ColorDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QtWidgets.QListView.Batched)
+        self.setBatchSize(16)
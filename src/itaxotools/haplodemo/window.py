@@ -156,33 +156,34 @@ class Window(QtWidgets.QWidget):
         self.label_format_dialog.show()
 
     def quick_save(self):
-        self.export_svg('graph.svg')
-        self.export_pdf('graph.pdf')
-        self.export_png('graph.png')
+        picture = self.scene_view.render_picture()
+        self.export_svg('graph.svg', picture)
+        self.export_pdf('graph.pdf', picture)
+        self.export_png('graph.png', picture)
 
-    def export_svg(self, file=None):
+    def export_svg(self, file=None, picture=None):
         if file is None:
             file, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, 'Export As...', 'graph.svg', 'SVG Files (*.svg)')
         if not file:
             return
         print('SVG >', file)
-        self.scene_view.export_svg(file)
+        self.scene_view.export_svg(file, picture)
 
-    def export_pdf(self, file=None):
+    def export_pdf(self, file=None, picture=None):
         if file is None:
             file, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, 'Export As...', 'graph.pdf', 'PDF Files (*.pdf)')
         if not file:
             return
         print('PDF >', file)
-        self.scene_view.export_pdf(file)
+        self.scene_view.export_pdf(file, picture)
 
-    def export_png(self, file=None):
+    def export_png(self, file=None, picture=None):
         if file is None:
             file, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, 'Export As...', 'graph.png', 'PNG Files (*.png)')
         if not file:
             return
         print('PNG >', file)
-        self.scene_view.export_png(file)
+        self.scene_view.export_png(file, picture)